@@ -8,10 +8,12 @@ import Utils from '../utils/Utils';
 export default class AuthorizedTagsCache {
   private static instance: AuthorizedTagsCache | null = null;
   private readonly tagsCaches: Map<string, string[]>;
+  private readonly tagsSetsCaches: Map<string, Set<string>>;
   private readonly FSWatchers: Map<string, fs.FSWatcher>;
 
   private constructor() {
     this.tagsCaches = new Map<string, string[]>();
+    this.tagsSetsCaches = new Map<string, Set<string>>();
     this.FSWatchers = new Map<string, fs.FSWatcher>();
   }
 
@@ -64,6 +66,17 @@ export default class AuthorizedTagsCache {
     return this.getTags(file);
   }
 
+  public hasAuthorizedTag(file: string, tag: string): boolean {
+    const authorizedTags = this.getAuthorizedTags(file);
+    if (!Array.isArray(authorizedTags)) {
+      return false;
+    }
+    if (!this.tagsSetsCaches.has(file)) {
+      this.tagsSetsCaches.set(file, new Set<string>(authorizedTags));
+    }
+    return this.tagsSetsCaches.get(file).has(tag);
+  }
+
   private hasTags(file: string): boolean {
     return this.tagsCaches.has(file);
   }
@@ -77,6 +90,7 @@ export default class AuthorizedTagsCache {
   }
 
   private deleteTags(file: string): boolean {
+    this.tagsSetsCaches.delete(file);
     return this.tagsCaches.delete(file);
   }
 
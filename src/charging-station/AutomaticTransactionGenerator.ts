@@ -103,16 +103,16 @@ export default class AutomaticTransactionGenerator {
 
   private async internalStartConnector(connectorId: number): Promise<void> {
     this.initializeConnectorStatus(connectorId);
+    const connectorStatus = this.connectorsStatus.get(connectorId);
     logger.info(
       this.logPrefix(connectorId) +
         ' started on connector and will run for ' +
         Utils.formatDurationMilliSeconds(
-          this.connectorsStatus.get(connectorId).stopDate.getTime() -
-            this.connectorsStatus.get(connectorId).startDate.getTime()
+          connectorStatus.stopDate.getTime() - connectorStatus.startDate.getTime()
         )
     );
-    while (this.connectorsStatus.get(connectorId).start) {
-      if (new Date() > this.connectorsStatus.get(connectorId).stopDate) {
+    while (connectorStatus.start) {
+      if (new Date() > connectorStatus.stopDate) {
         this.stopConnector(connectorId);
         break;
       }
@@ -149,7 +149,10 @@ export default class AutomaticTransactionGenerator {
         );
         do {
           await Utils.sleep(Constants.CHARGING_STATION_ATG_INITIALIZATION_TIME);
-        } while (!this.chargingStation?.ocppRequestService);
+        } while (!this.chargingStation?.ocppRequestService && connectorStatus.start);
+        if (!connectorStatus.start) {
+          break;
+        }
       }
       const wait =
         Utils.getRandomInteger(
@@ -160,15 +163,19 @@ export default class AutomaticTransactionGenerator {
         this.logPrefix(connectorId) + ' waiting for ' + Utils.formatDurationMilliSeconds(wait)
       );
       await Utils.sleep(wait);
+      // Do not start a new transaction if the connector has been stopped while waiting
+      if (!connectorStatus.start) {
+        break;
+      }
       const start = Utils.secureRandom();
       if (start < this.configuration.probabilityOfStart) {
-        this.connectorsStatus.get(connectorId).skippedConsecutiveTransactions = 0;
+        connectorStatus.skippedConsecutiveTransactions = 0;
         // Start transaction
         const startResponse = await this.startTransaction(connectorId);
-        this.connectorsStatus.get(connectorId).startTransactionRequests++;
+        connectorStatus.startTransactionRequests++;
         if (startResponse?.idTagInfo?.status !== AuthorizationStatus.ACCEPTED) {
           logger.warn(this.logPrefix(connectorId) + ' start transaction rejected');
-          this.connectorsStatus.get(connectorId).rejectedStartTransactionRequests++;
+          connectorStatus.rejectedStartTransactionRequests++;
         } else {
           // Wait until end of transaction
           const waitTrxEnd =
@@ -181,7 +188,7 @@ export default class AutomaticTransactionGenerator {
               ' started and will stop in ' +
               Utils.formatDurationMilliSeconds(waitTrxEnd)
           );
-          this.connectorsStatus.get(connectorId).acceptedStartTransactionRequests++;
+          connectorStatus.acceptedStartTransactionRequests++;
           await Utils.sleep(waitTrxEnd);
           // Stop transaction
           logger.info(
@@ -192,33 +199,29 @@ export default class AutomaticTransactionGenerator {
           await this.stopTransaction(connectorId);
         }
       } else {
-        this.connectorsStatus.get(connectorId).skippedConsecutiveTransactions++;
-        this.connectorsStatus.get(connectorId).skippedTransactions++;
+        connectorStatus.skippedConsecutiveTransactions++;
+        connectorStatus.skippedTransactions++;
         logger.info(
           this.logPrefix(connectorId) +
             ' skipped consecutively ' +
-            this.connectorsStatus.get(connectorId).skippedConsecutiveTransactions.toString() +
+            connectorStatus.skippedConsecutiveTransactions.toString() +
             '/' +
-            this.connectorsStatus.get(connectorId).skippedTransactions.toString() +
+            connectorStatus.skippedTransactions.toString() +
             ' transaction(s)'
         );
       }
-      this.connectorsStatus.get(connectorId).lastRunDate = new Date();
+      connectorStatus.lastRunDate = new Date();
     }
     await this.stopTransaction(connectorId);
-    this.connectorsStatus.get(connectorId).stoppedDate = new Date();
+    connectorStatus.stoppedDate = new Date();
     logger.info(
       this.logPrefix(connectorId) +
         ' stopped on connector and lasted for ' +
         Utils.formatDurationMilliSeconds(
-          this.connectorsStatus.get(connectorId).stoppedDate.getTime() -
-            this.connectorsStatus.get(connectorId).startDate.getTime()
+          connectorStatus.stoppedDate.getTime() - connectorStatus.startDate.getTime()
         )
     );
-    logger.debug(
-      `${this.logPrefix(connectorId)} connector status %j`,
-      this.connectorsStatus.get(connectorId)
-    );
+    logger.debug(`${this.logPrefix(connectorId)} connector status %j`, connectorStatus);
   }
 
   private startConnector(connectorId: number): void {
@@ -231,46 +234,41 @@ export default class AutomaticTransactionGenerator {
   }
 
   private stopConnector(connectorId: number): void {
-    this.connectorsStatus.set(connectorId, {
-      ...this.connectorsStatus.get(connectorId),
-      start: false,
-    });
+    // Update in place to keep the status reference held by the transaction loop valid
+    if (this.connectorsStatus.has(connectorId)) {
+      this.connectorsStatus.get(connectorId).start = false;
+    } else {
+      this.connectorsStatus.set(connectorId, { start: false });
+    }
   }
 
   private initializeConnectorStatus(connectorId: number): void {
-    this.connectorsStatus.get(connectorId).authorizeRequests =
-      this?.connectorsStatus.get(connectorId)?.authorizeRequests ?? 0;
-    this.connectorsStatus.get(connectorId).acceptedAuthorizeRequests =
-      this?.connectorsStatus.get(connectorId)?.acceptedAuthorizeRequests ?? 0;
-    this.connectorsStatus.get(connectorId).rejectedAuthorizeRequests =
-      this?.connectorsStatus.get(connectorId)?.rejectedAuthorizeRequests ?? 0;
-    this.connectorsStatus.get(connectorId).startTransactionRequests =
-      this?.connectorsStatus.get(connectorId)?.startTransactionRequests ?? 0;
-    this.connectorsStatus.get(connectorId).acceptedStartTransactionRequests =
-      this?.connectorsStatus.get(connectorId)?.acceptedStartTransactionRequests ?? 0;
-    this.connectorsStatus.get(connectorId).rejectedStartTransactionRequests =
-      this?.connectorsStatus.get(connectorId)?.rejectedStartTransactionRequests ?? 0;
-    this.connectorsStatus.get(connectorId).stopTransactionRequests =
-      this?.connectorsStatus.get(connectorId)?.stopTransactionRequests ?? 0;
-    this.connectorsStatus.get(connectorId).skippedConsecutiveTransactions = 0;
-    this.connectorsStatus.get(connectorId).skippedTransactions =
-      this?.connectorsStatus.get(connectorId)?.skippedTransactions ?? 0;
+    const connectorStatus = this.connectorsStatus.get(connectorId);
+    connectorStatus.authorizeRequests = connectorStatus.authorizeRequests ?? 0;
+    connectorStatus.acceptedAuthorizeRequests = connectorStatus.acceptedAuthorizeRequests ?? 0;
+    connectorStatus.rejectedAuthorizeRequests = connectorStatus.rejectedAuthorizeRequests ?? 0;
+    connectorStatus.startTransactionRequests = connectorStatus.startTransactionRequests ?? 0;
+    connectorStatus.acceptedStartTransactionRequests =
+      connectorStatus.acceptedStartTransactionRequests ?? 0;
+    connectorStatus.rejectedStartTransactionRequests =
+      connectorStatus.rejectedStartTransactionRequests ?? 0;
+    connectorStatus.stopTransactionRequests = connectorStatus.stopTransactionRequests ?? 0;
+    connectorStatus.skippedConsecutiveTransactions = 0;
+    connectorStatus.skippedTransactions = connectorStatus.skippedTransactions ?? 0;
     const previousRunDuration =
-      this?.connectorsStatus.get(connectorId)?.startDate &&
-      this?.connectorsStatus.get(connectorId)?.lastRunDate
-        ? this.connectorsStatus.get(connectorId).lastRunDate.getTime() -
-          this.connectorsStatus.get(connectorId).startDate.getTime()
+      connectorStatus.startDate && connectorStatus.lastRunDate
+        ? connectorStatus.lastRunDate.getTime() - connectorStatus.startDate.getTime()
         : 0;
-    this.connectorsStatus.get(connectorId).startDate = new Date();
-    this.connectorsStatus.get(connectorId).stopDate = new Date(
-      this.connectorsStatus.get(connectorId).startDate.getTime() +
+    connectorStatus.startDate = new Date();
+    connectorStatus.stopDate = new Date(
+      connectorStatus.startDate.getTime() +
         (this.configuration.stopAfterHours ??
           Constants.CHARGING_STATION_ATG_DEFAULT_STOP_AFTER_HOURS) *
           3600 *
           1000 -
         previousRunDuration
     );
-    this.connectorsStatus.get(connectorId).start = true;
+    connectorStatus.start = true;
   }
 
   private async startTransaction(
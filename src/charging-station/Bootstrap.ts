@@ -45,15 +45,17 @@ export default class Bootstrap {
       'ChargingStationWorker' + path.extname(fileURLToPath(import.meta.url))
     );
     this.initialize();
-    Configuration.getUIServer().enabled &&
+    const uiServerConfiguration = Configuration.getUIServer();
+    uiServerConfiguration.enabled &&
       (this.uiServer = UIServerFactory.getUIServerImplementation(ApplicationProtocol.WS, {
-        ...Configuration.getUIServer().options,
+        ...uiServerConfiguration.options,
         handleProtocols: UIServiceUtils.handleProtocols,
       }));
-    Configuration.getPerformanceStorage().enabled &&
+    const performanceStorageConfiguration = Configuration.getPerformanceStorage();
+    performanceStorageConfiguration.enabled &&
       (this.storage = StorageFactory.getStorage(
-        Configuration.getPerformanceStorage().type,
-        Configuration.getPerformanceStorage().uri,
+        performanceStorageConfiguration.type,
+        performanceStorageConfiguration.uri,
         this.logPrefix()
       ));
     Configuration.setConfigurationChangeCallback(async () => Bootstrap.getInstance().restart());
@@ -152,30 +154,33 @@ export default class Bootstrap {
   }
 
   private initializeWorkerImplementation(): void {
-    !this.workerImplementation &&
-      (this.workerImplementation = WorkerFactory.getWorkerImplementation<ChargingStationWorkerData>(
-        this.workerScript,
-        Configuration.getWorker().processType,
-        {
-          workerStartDelay: Configuration.getWorker().startDelay,
-          elementStartDelay: Configuration.getWorker().elementStartDelay,
-          poolMaxSize: Configuration.getWorker().poolMaxSize,
-          poolMinSize: Configuration.getWorker().poolMinSize,
-          elementsPerWorker: Configuration.getWorker().elementsPerWorker,
-          poolOptions: {
-            workerChoiceStrategy: Configuration.getWorker().poolStrategy,
-          },
-          messageHandler: async (msg: ChargingStationWorkerMessage) => {
-            if (msg.id === ChargingStationWorkerMessageEvents.STARTED) {
-              this.uiServer.chargingStations.add(msg.data.id as string);
-            } else if (msg.id === ChargingStationWorkerMessageEvents.STOPPED) {
-              this.uiServer.chargingStations.delete(msg.data.id as string);
-            } else if (msg.id === ChargingStationWorkerMessageEvents.PERFORMANCE_STATISTICS) {
-              await this.storage.storePerformanceStatistics(msg.data as unknown as Statistics);
-            }
-          },
-        }
-      ));
+    if (this.workerImplementation) {
+      return;
+    }
+    const workerConfiguration = Configuration.getWorker();
+    this.workerImplementation = WorkerFactory.getWorkerImplementation<ChargingStationWorkerData>(
+      this.workerScript,
+      workerConfiguration.processType,
+      {
+        workerStartDelay: workerConfiguration.startDelay,
+        elementStartDelay: workerConfiguration.elementStartDelay,
+        poolMaxSize: workerConfiguration.poolMaxSize,
+        poolMinSize: workerConfiguration.poolMinSize,
+        elementsPerWorker: workerConfiguration.elementsPerWorker,
+        poolOptions: {
+          workerChoiceStrategy: workerConfiguration.poolStrategy,
+        },
+        messageHandler: async (msg: ChargingStationWorkerMessage) => {
+          if (msg.id === ChargingStationWorkerMessageEvents.STARTED) {
+            this.uiServer?.chargingStations.add(msg.data.id as string);
+          } else if (msg.id === ChargingStationWorkerMessageEvents.STOPPED) {
+            this.uiServer?.chargingStations.delete(msg.data.id as string);
+          } else if (msg.id === ChargingStationWorkerMessageEvents.PERFORMANCE_STATISTICS) {
+            await this.storage.storePerformanceStatistics(msg.data as unknown as Statistics);
+          }
+        },
+      }
+    );
   }
 
   private initialize() {
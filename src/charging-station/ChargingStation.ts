@@ -99,6 +99,7 @@ export default class ChargingStation {
   private readonly index: number;
   private configurationFile!: string;
   private configurationFileHash!: string;
+  private authorizationFile!: string | undefined;
   private bootNotificationRequest!: BootNotificationRequest;
   private connectorsConfigurationHash!: string;
   private ocppIncomingRequestService!: OCPPIncomingRequestService;
@@ -153,19 +154,16 @@ export default class ChargingStation {
   }
 
   public getRandomIdTag(): string {
-    const authorizationFile = ChargingStationUtils.getAuthorizationFile(this.stationInfo);
-    const index = Math.floor(
-      Utils.secureRandom() * this.authorizedTagsCache.getAuthorizedTags(authorizationFile).length
-    );
-    return this.authorizedTagsCache.getAuthorizedTags(authorizationFile)[index];
+    const authorizedTags = this.authorizedTagsCache.getAuthorizedTags(this.authorizationFile);
+    return authorizedTags[Math.floor(Utils.secureRandom() * authorizedTags.length)];
   }
 
   public hasAuthorizedTags(): boolean {
-    return !Utils.isEmptyArray(
-      this.authorizedTagsCache.getAuthorizedTags(
-        ChargingStationUtils.getAuthorizationFile(this.stationInfo)
-      )
-    );
+    return !Utils.isEmptyArray(this.authorizedTagsCache.getAuthorizedTags(this.authorizationFile));
+  }
+
+  public hasAuthorizedTag(idTag: string): boolean {
+    return this.authorizedTagsCache.hasAuthorizedTag(this.authorizationFile, idTag);
   }
 
   public getEnableStatistics(): boolean | undefined {
@@ -420,21 +418,19 @@ export default class ChargingStation {
       );
       return;
     }
-    if (!this.getConnectorStatus(connectorId)) {
+    const connectorStatus = this.getConnectorStatus(connectorId);
+    if (!connectorStatus) {
       logger.error(
         `${this.logPrefix()} Trying to start MeterValues on non existing connector Id ${connectorId.toString()}`
       );
       return;
     }
-    if (!this.getConnectorStatus(connectorId)?.transactionStarted) {
+    if (!connectorStatus.transactionStarted) {
       logger.error(
         `${this.logPrefix()} Trying to start MeterValues on connector Id ${connectorId} with no transaction started`
       );
       return;
-    } else if (
-      this.getConnectorStatus(connectorId)?.transactionStarted &&
-      !this.getConnectorStatus(connectorId)?.transactionId
-    ) {
+    } else if (connectorStatus.transactionStarted && !connectorStatus.transactionId) {
       logger.error(
         `${this.logPrefix()} Trying to start MeterValues on connector Id ${connectorId} with no transaction id`
       );
@@ -442,14 +438,14 @@ export default class ChargingStation {
     }
     if (interval > 0) {
       // eslint-disable-next-line @typescript-eslint/no-misused-promises
-      this.getConnectorStatus(connectorId).transactionSetInterval = setInterval(
+      connectorStatus.transactionSetInterval = setInterval(
         // eslint-disable-next-line @typescript-eslint/no-misused-promises
         async (): Promise<void> => {
           // FIXME: Implement OCPP version agnostic helpers
           const meterValue: MeterValue = OCPP16ServiceUtils.buildMeterValue(
             this,
             connectorId,
-            this.getConnectorStatus(connectorId).transactionId,
+            connectorStatus.transactionId,
             interval
           );
           await this.ocppRequestService.requestHandler<MeterValuesRequest, MeterValuesResponse>(
@@ -457,7 +453,7 @@ export default class ChargingStation {
             RequestCommand.METER_VALUES,
             {
               connectorId,
-              transactionId: this.getConnectorStatus(connectorId).transactionId,
+              transactionId: connectorStatus.transactionId,
               meterValue: [meterValue],
             }
           );
@@ -673,13 +669,15 @@ export default class ChargingStation {
     this.messageBuffer.add(message);
   }
 
-  private flushMessageBuffer() {
-    if (this.messageBuffer.size > 0) {
-      this.messageBuffer.forEach((message) => {
-        // TODO: evaluate the need to track performance
-        this.wsConnection.send(message);
-        this.messageBuffer.delete(message);
-      });
+  private flushMessageBuffer(): void {
+    // ws only updates readyState from event callbacks, so it cannot change during the loop
+    if (!this.isWebSocketConnectionOpened()) {
+      return;
+    }
+    for (const message of this.messageBuffer) {
+      // TODO: evaluate the need to track performance
+      this.wsConnection.send(message);
+      this.messageBuffer.delete(message);
     }
   }
 
@@ -871,6 +869,7 @@ export default class ChargingStation {
     // Avoid duplication of connectors related information in RAM
     this.stationInfo?.Connectors && delete this.stationInfo.Connectors;
     this.configuredSupervisionUrl = this.getConfiguredSupervisionUrl();
+    this.authorizationFile = ChargingStationUtils.getAuthorizationFile(this.stationInfo);
     if (this.getEnableStatistics()) {
       this.performanceStatistics = PerformanceStatistics.getInstance(
         this.hashId,
@@ -899,7 +898,7 @@ export default class ChargingStation {
     }
     if (this.stationInfo?.autoRegister) {
       this.bootNotificationResponse = {
-        currentTime: new Date().toISOString(),
+        currentTime: Utils.getISODateString(),
         interval: this.getHeartbeatInterval() / 1000,
         status: RegistrationStatus.ACCEPTED,
       };
@@ -1261,22 +1260,9 @@ export default class ChargingStation {
           this.bootNotificationResponse = await this.ocppRequestService.requestHandler<
             BootNotificationRequest,
             BootNotificationResponse
-          >(
-            this,
-            RequestCommand.BOOT_NOTIFICATION,
-            {
-              chargePointModel: this.bootNotificationRequest.chargePointModel,
-              chargePointVendor: this.bootNotificationRequest.chargePointVendor,
-              chargeBoxSerialNumber: this.bootNotificationRequest.chargeBoxSerialNumber,
-              firmwareVersion: this.bootNotificationRequest.firmwareVersion,
-              chargePointSerialNumber: this.bootNotificationRequest.chargePointSerialNumber,
-              iccid: this.bootNotificationRequest.iccid,
-              imsi: this.bootNotificationRequest.imsi,
-              meterSerialNumber: this.bootNotificationRequest.meterSerialNumber,
-              meterType: this.bootNotificationRequest.meterType,
-            },
-            { skipBufferingOnError: true }
-          );
+          >(this, RequestCommand.BOOT_NOTIFICATION, this.bootNotificationRequest, {
+            skipBufferingOnError: true,
+          });
           if (!this.isRegistered()) {
             this.getRegistrationMaxRetries() !== -1 && registrationRetryCount++;
             await Utils.sleep(
@@ -1349,8 +1335,9 @@ export default class ChargingStation {
     let requestPayload: JsonType;
     let cachedRequest: CachedRequest;
     let errMsg: string;
+    const message = data.toString();
     try {
-      const request = JSON.parse(data.toString()) as IncomingRequest | Response | ErrorResponse;
+      const request = JSON.parse(message) as IncomingRequest | Response | ErrorResponse;
       if (Utils.isIterable(request)) {
         [messageType, messageId] = request;
         // Check the type of message
@@ -1361,11 +1348,10 @@ export default class ChargingStation {
             if (this.getEnableStatistics()) {
               this.performanceStatistics.addRequestStatistic(commandName, messageType);
             }
-            logger.debug(
-              `${this.logPrefix()} << Command '${commandName}' received request payload: ${JSON.stringify(
-                request
-              )}`
-            );
+            logger.isDebugEnabled() &&
+              logger.debug(
+                `${this.logPrefix()} << Command '${commandName}' received request payload: ${message}`
+              );
             // Process the message
             await this.ocppIncomingRequestService.incomingRequestHandler(
               this,
@@ -1398,11 +1384,12 @@ export default class ChargingStation {
                 cachedRequest as unknown as JsonType
               );
             }
-            logger.debug(
-              `${this.logPrefix()} << Command '${
-                requestCommandName ?? 'unknown'
-              }' received response payload: ${JSON.stringify(request)}`
-            );
+            logger.isDebugEnabled() &&
+              logger.debug(
+                `${this.logPrefix()} << Command '${
+                  requestCommandName ?? 'unknown'
+                }' received response payload: ${message}`
+              );
             responseCallback(commandPayload, requestPayload);
             break;
           // Error Message
@@ -1428,11 +1415,12 @@ export default class ChargingStation {
                 cachedRequest as unknown as JsonType
               );
             }
-            logger.debug(
-              `${this.logPrefix()} << Command '${
-                requestCommandName ?? 'unknown'
-              }' received error payload: ${JSON.stringify(request)}`
-            );
+            logger.isDebugEnabled() &&
+              logger.debug(
+                `${this.logPrefix()} << Command '${
+                  requestCommandName ?? 'unknown'
+                }' received error payload: ${message}`
+              );
             errorCallback(new OCPPError(errorType, errorMessage, requestCommandName, errorDetails));
             break;
           // Error
@@ -1448,21 +1436,23 @@ export default class ChargingStation {
         });
       }
     } catch (error) {
+      const logPrefix = this.logPrefix();
+      const errorCommandName = commandName ?? requestCommandName ?? null;
       // Log
       logger.error(
         "%s Incoming OCPP '%s' message '%j' matching cached request '%j' processing error: %j",
-        this.logPrefix(),
-        commandName ?? requestCommandName ?? null,
-        data.toString(),
+        logPrefix,
+        errorCommandName,
+        message,
         this.requests.get(messageId),
         error
       );
       if (!(error instanceof OCPPError)) {
         logger.warn(
           "%s Error thrown at incoming OCPP '%s' message '%j' handling is not an OCPPError: %j",
-          this.logPrefix(),
-          commandName ?? requestCommandName ?? null,
-          data.toString(),
+          logPrefix,
+          errorCommandName,
+          message,
           error
         );
       }
@@ -1472,17 +1462,19 @@ export default class ChargingStation {
           this,
           messageId,
           error as OCPPError,
-          commandName ?? requestCommandName ?? null
+          errorCommandName
         ));
     }
   }
 
   private onPing(): void {
-    logger.debug(this.logPrefix() + ' Received a WS ping (rfc6455) from the server');
+    logger.isDebugEnabled() &&
+      logger.debug(this.logPrefix() + ' Received a WS ping (rfc6455) from the server');
   }
 
   private onPong(): void {
-    logger.debug(this.logPrefix() + ' Received a WS pong (rfc6455) from the server');
+    logger.isDebugEnabled() &&
+      logger.debug(this.logPrefix() + ' Received a WS pong (rfc6455) from the server');
   }
 
   private onError(error: WSError): void {
@@ -1597,22 +1589,9 @@ export default class ChargingStation {
       await this.ocppRequestService.requestHandler<
         BootNotificationRequest,
         BootNotificationResponse
-      >(
-        this,
-        RequestCommand.BOOT_NOTIFICATION,
-        {
-          chargePointModel: this.bootNotificationRequest.chargePointModel,
-          chargePointVendor: this.bootNotificationRequest.chargePointVendor,
-          chargeBoxSerialNumber: this.bootNotificationRequest.chargeBoxSerialNumber,
-          firmwareVersion: this.bootNotificationRequest.firmwareVersion,
-          chargePointSerialNumber: this.bootNotificationRequest.chargePointSerialNumber,
-          iccid: this.bootNotificationRequest.iccid,
-          imsi: this.bootNotificationRequest.imsi,
-          meterSerialNumber: this.bootNotificationRequest.meterSerialNumber,
-          meterType: this.bootNotificationRequest.meterType,
-        },
-        { skipBufferingOnError: true }
-      );
+      >(this, RequestCommand.BOOT_NOTIFICATION, this.bootNotificationRequest, {
+        skipBufferingOnError: true,
+      });
     }
     // Start WebSocket ping
     this.startWebSocketPing();
@@ -1797,6 +1776,7 @@ export default class ChargingStation {
   private stopWebSocketPing(): void {
     if (this.webSocketPingSetInterval) {
       clearInterval(this.webSocketPingSetInterval);
+      this.webSocketPingSetInterval = undefined;
     }
   }
 
@@ -1864,6 +1844,7 @@ export default class ChargingStation {
   private stopHeartbeat(): void {
     if (this.heartbeatSetInterval) {
       clearInterval(this.heartbeatSetInterval);
+      this.heartbeatSetInterval = undefined;
     }
   }
 
@@ -1875,6 +1856,7 @@ export default class ChargingStation {
     }
   ): void {
     options.handshakeTimeout = options?.handshakeTimeout ?? this.getConnectionTimeout() * 1000;
+    options.perMessageDeflate = options?.perMessageDeflate ?? false;
     params.closeOpened = params?.closeOpened ?? false;
     params.terminateOpened = params?.terminateOpened ?? false;
     if (
@@ -1945,6 +1927,7 @@ export default class ChargingStation {
   private stopMeterValues(connectorId: number) {
     if (this.getConnectorStatus(connectorId)?.transactionSetInterval) {
       clearInterval(this.getConnectorStatus(connectorId).transactionSetInterval);
+      this.getConnectorStatus(connectorId).transactionSetInterval = undefined;
     }
   }
 
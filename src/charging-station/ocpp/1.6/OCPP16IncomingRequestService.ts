@@ -78,7 +78,6 @@ import logger from '../../../utils/Logger';
 import Utils from '../../../utils/Utils';
 import type ChargingStation from '../../ChargingStation';
 import { ChargingStationConfigurationUtils } from '../../ChargingStationConfigurationUtils';
-import { ChargingStationUtils } from '../../ChargingStationUtils';
 import OCPPIncomingRequestService from '../OCPPIncomingRequestService';
 import { OCPP16ServiceUtils } from './OCPP16ServiceUtils';
 
@@ -157,13 +156,11 @@ export default class OCPP16IncomingRequestService extends OCPPIncomingRequestSer
       chargingStation.isRegistered() ||
       (!chargingStation.getOcppStrictCompliance() && chargingStation.isInUnknownState())
     ) {
-      if (this.incomingRequestHandlers.has(commandName)) {
+      const incomingRequestHandler = this.incomingRequestHandlers.get(commandName);
+      if (incomingRequestHandler) {
         try {
           // Call the method to build the response
-          response = await this.incomingRequestHandlers.get(commandName)(
-            chargingStation,
-            commandPayload
-          );
+          response = await incomingRequestHandler(chargingStation, commandPayload);
         } catch (error) {
           // Log
           logger.error(chargingStation.logPrefix() + ' Handle request error: %j', error);
@@ -619,11 +616,7 @@ export default class OCPP16IncomingRequestService extends OCPPIncomingRequestSer
           if (
             chargingStation.getLocalAuthListEnabled() &&
             chargingStation.hasAuthorizedTags() &&
-            chargingStation.authorizedTagsCache
-              .getAuthorizedTags(
-                ChargingStationUtils.getAuthorizationFile(chargingStation.stationInfo)
-              )
-              .find((value) => value === commandPayload.idTag)
+            chargingStation.hasAuthorizedTag(commandPayload.idTag)
           ) {
             connectorStatus.localAuthorizeIdTag = commandPayload.idTag;
             connectorStatus.idTagLocalAuthorized = true;
@@ -1015,19 +1008,7 @@ export default class OCPP16IncomingRequestService extends OCPPIncomingRequestSer
               .requestHandler<OCPP16BootNotificationRequest, OCPP16BootNotificationResponse>(
                 chargingStation,
                 OCPP16RequestCommand.BOOT_NOTIFICATION,
-                {
-                  chargePointModel: chargingStation.getBootNotificationRequest().chargePointModel,
-                  chargePointVendor: chargingStation.getBootNotificationRequest().chargePointVendor,
-                  chargeBoxSerialNumber:
-                    chargingStation.getBootNotificationRequest().chargeBoxSerialNumber,
-                  firmwareVersion: chargingStation.getBootNotificationRequest().firmwareVersion,
-                  chargePointSerialNumber:
-                    chargingStation.getBootNotificationRequest().chargePointSerialNumber,
-                  iccid: chargingStation.getBootNotificationRequest().iccid,
-                  imsi: chargingStation.getBootNotificationRequest().imsi,
-                  meterSerialNumber: chargingStation.getBootNotificationRequest().meterSerialNumber,
-                  meterType: chargingStation.getBootNotificationRequest().meterType,
-                },
+                chargingStation.getBootNotificationRequest(),
                 { skipBufferingOnError: true, triggerMessage: true }
               )
               .then((value) => {
@@ -15,6 +15,9 @@ import { OCPP16ServiceUtils } from './OCPP16ServiceUtils';
 const moduleName = 'OCPP16RequestService';
 
 export default class OCPP16RequestService extends OCPPRequestService {
+  private static readonly requestCommands: Set<OCPP16RequestCommand> =
+    new Set<OCPP16RequestCommand>(Object.values(OCPP16RequestCommand));
+
   public constructor(ocppResponseService: OCPPResponseService) {
     if (new.target?.name === moduleName) {
       throw new TypeError(`Cannot construct ${new.target?.name} instances directly`);
@@ -28,7 +31,7 @@ export default class OCPP16RequestService extends OCPPRequestService {
     commandParams?: JsonType,
     params?: RequestParams
   ): Promise<Response> {
-    if (Object.values(OCPP16RequestCommand).includes(commandName)) {
+    if (OCPP16RequestService.requestCommands.has(commandName)) {
       return (await this.sendMessage(
         chargingStation,
         Utils.generateUUID(),
@@ -86,7 +89,7 @@ export default class OCPP16RequestService extends OCPPRequestService {
           status: commandParams?.diagnosticsStatus,
         } as unknown as Request;
       case OCPP16RequestCommand.HEARTBEAT:
-        return {} as unknown as Request;
+        return Constants.OCPP_REQUEST_EMPTY as unknown as Request;
       case OCPP16RequestCommand.METER_VALUES:
         // Sanity check
         if (!Array.isArray(commandParams?.meterValue)) {
@@ -117,7 +120,7 @@ export default class OCPP16RequestService extends OCPPRequestService {
           meterStart: chargingStation.getEnergyActiveImportRegisterByConnectorId(
             commandParams?.connectorId as number
           ),
-          timestamp: new Date().toISOString(),
+          timestamp: Utils.getISODateString(),
         } as unknown as Request;
       case OCPP16RequestCommand.STOP_TRANSACTION:
         connectorId = chargingStation.getConnectorIdByTransactionId(
@@ -127,7 +130,7 @@ export default class OCPP16RequestService extends OCPPRequestService {
           transactionId: commandParams?.transactionId,
           ...(!Utils.isUndefined(commandParams?.idTag) && { idTag: commandParams.idTag }),
           meterStop: commandParams?.meterStop,
-          timestamp: new Date().toISOString(),
+          timestamp: Utils.getISODateString(),
           ...(commandParams?.reason && { reason: commandParams.reason }),
           ...(chargingStation.getTransactionDataMeterValues() && {
             transactionData: OCPP16ServiceUtils.buildTransactionDataMeterValues(
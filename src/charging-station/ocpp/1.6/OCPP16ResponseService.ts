@@ -40,6 +40,9 @@ import { OCPP16ServiceUtils } from './OCPP16ServiceUtils';
 const moduleName = 'OCPP16ResponseService';
 
 export default class OCPP16ResponseService extends OCPPResponseService {
+  private static readonly registrationStatuses: Set<OCPP16RegistrationStatus> =
+    new Set<OCPP16RegistrationStatus>(Object.values(OCPP16RegistrationStatus));
+
   private responseHandlers: Map<OCPP16RequestCommand, ResponseHandler>;
 
   public constructor() {
@@ -65,9 +68,10 @@ export default class OCPP16ResponseService extends OCPPResponseService {
     requestPayload: JsonType
   ): Promise<void> {
     if (chargingStation.isRegistered() || commandName === OCPP16RequestCommand.BOOT_NOTIFICATION) {
-      if (this.responseHandlers.has(commandName)) {
+      const responseHandler = this.responseHandlers.get(commandName);
+      if (responseHandler) {
         try {
-          await this.responseHandlers.get(commandName)(chargingStation, payload, requestPayload);
+          await responseHandler(chargingStation, payload, requestPayload);
         } catch (error) {
           logger.error(chargingStation.logPrefix() + ' Handle request response error: %j', error);
           throw error;
@@ -122,7 +126,7 @@ export default class OCPP16ResponseService extends OCPPResponseService {
         ? chargingStation.restartHeartbeat()
         : chargingStation.startHeartbeat();
     }
-    if (Object.values(OCPP16RegistrationStatus).includes(payload.status)) {
+    if (OCPP16ResponseService.registrationStatuses.has(payload.status)) {
       const logMsg = `${chargingStation.logPrefix()} Charging station in '${
         payload.status
       }' state on the central server`;
@@ -158,19 +162,21 @@ export default class OCPP16ResponseService extends OCPPResponseService {
     }
     if (payload.idTagInfo.status === OCPP16AuthorizationStatus.ACCEPTED) {
       chargingStation.getConnectorStatus(authorizeConnectorId).idTagAuthorized = true;
-      logger.debug(
-        `${chargingStation.logPrefix()} IdTag ${
-          requestPayload.idTag
-        } authorized on connector ${authorizeConnectorId}`
-      );
+      logger.isDebugEnabled() &&
+        logger.debug(
+          `${chargingStation.logPrefix()} IdTag ${
+            requestPayload.idTag
+          } authorized on connector ${authorizeConnectorId}`
+        );
     } else {
       chargingStation.getConnectorStatus(authorizeConnectorId).idTagAuthorized = false;
       delete chargingStation.getConnectorStatus(authorizeConnectorId).authorizeIdTag;
-      logger.debug(
-        `${chargingStation.logPrefix()} IdTag ${requestPayload.idTag} refused with status '${
-          payload.idTagInfo.status
-        }' on connector ${authorizeConnectorId}`
-      );
+      logger.isDebugEnabled() &&
+        logger.debug(
+          `${chargingStation.logPrefix()} IdTag ${requestPayload.idTag} refused with status '${
+            payload.idTagInfo.status
+          }' on connector ${authorizeConnectorId}`
+        );
     }
   }
 
@@ -181,14 +187,7 @@ export default class OCPP16ResponseService extends OCPPResponseService {
   ): Promise<void> {
     const connectorId = requestPayload.connectorId;
 
-    let transactionConnectorId: number;
-    for (const id of chargingStation.connectors.keys()) {
-      if (id > 0 && id === connectorId) {
-        transactionConnectorId = id;
-        break;
-      }
-    }
-    if (!transactionConnectorId) {
+    if (connectorId <= 0 || !chargingStation.connectors.has(connectorId)) {
       logger.error(
         chargingStation.logPrefix() +
           ' Trying to start a transaction on a non existing connector Id ' +
@@ -21,14 +21,22 @@ import type OCPPResponseService from './OCPPResponseService';
 
 export default abstract class OCPPRequestService {
   private static instance: OCPPRequestService | null = null;
+  private static readonly messageTypeStrings: Map<MessageType, string> = new Map<
+    MessageType,
+    string
+  >([
+    [MessageType.CALL_MESSAGE, 'request'],
+    [MessageType.CALL_RESULT_MESSAGE, 'response'],
+    [MessageType.CALL_ERROR_MESSAGE, 'error'],
+  ]);
 
   private readonly ocppResponseService: OCPPResponseService;
 
   protected constructor(ocppResponseService: OCPPResponseService) {
     this.ocppResponseService = ocppResponseService;
-    this.requestHandler.bind(this);
-    this.sendResponse.bind(this);
-    this.sendError.bind(this);
+    this.requestHandler = this.requestHandler.bind(this);
+    this.sendResponse = this.sendResponse.bind(this);
+    this.sendError = this.sendError.bind(this);
   }
 
   public static getInstance<T extends OCPPRequestService>(
@@ -147,11 +155,12 @@ export default abstract class OCPPRequestService {
             // FIXME: Handle sending error
             chargingStation.wsConnection.send(messageToSend);
             PerformanceStatistics.endMeasure(commandName, beginId);
-            logger.debug(
-              `${chargingStation.logPrefix()} >> Command '${commandName}' sent ${this.getMessageTypeString(
-                messageType
-              )} payload: ${messageToSend}`
-            );
+            logger.isDebugEnabled() &&
+              logger.debug(
+                `${chargingStation.logPrefix()} >> Command '${commandName}' sent ${this.getMessageTypeString(
+                  messageType
+                )} payload: ${messageToSend}`
+              );
           } else if (!params.skipBufferingOnError) {
             // Buffer it
             chargingStation.bufferMessage(messageToSend);
@@ -162,7 +171,10 @@ export default abstract class OCPPRequestService {
               (messagePayload as JsonObject)?.details ?? {}
             );
             if (messageType === MessageType.CALL_MESSAGE) {
-              // Reject it but keep the request in the cache
+              // Reject it but keep the request in the cache until the OCPP timeout
+              setTimeout(() => {
+                chargingStation.requests.delete(messageId);
+              }, Constants.OCPP_WEBSOCKET_TIMEOUT);
               return reject(ocppError);
             }
             return errorCallback(ocppError, false);
@@ -307,14 +319,7 @@ export default abstract class OCPPRequestService {
   }
 
   private getMessageTypeString(messageType: MessageType): string {
-    switch (messageType) {
-      case MessageType.CALL_MESSAGE:
-        return 'request';
-      case MessageType.CALL_RESULT_MESSAGE:
-        return 'response';
-      case MessageType.CALL_ERROR_MESSAGE:
-        return 'error';
-    }
+    return OCPPRequestService.messageTypeStrings.get(messageType);
   }
 
   private handleRequestError(
@@ -4,6 +4,7 @@ import WebSocket from 'ws';
 
 import { ServerOptions } from '../../types/ConfigurationData';
 import { Protocol, ProtocolVersion } from '../../types/UIProtocol';
+import { WebSocketCloseEventStatusCode } from '../../types/WebSocket';
 import Configuration from '../../utils/Configuration';
 import logger from '../../utils/Logger';
 import Utils from '../../utils/Utils';
@@ -18,25 +19,32 @@ export default class UIWebSocketServer extends AbstractUIServer {
 
   public start(): void {
     this.server.on('connection', (socket: WebSocket, request: IncomingMessage): void => {
-      const protocolIndex = socket.protocol.indexOf(Protocol.UI);
+      socket.on('error', (error) => {
+        logger.error(`${this.logPrefix()} Error on WebSocket: %j`, error);
+      });
+      // ws accepts the upgrade without a subprotocol when none is offered
+      // or when handleProtocols rejects them
+      if (!socket.protocol) {
+        logger.error(`${this.logPrefix()} No UI protocol negotiated, closing the connection`);
+        socket.close(WebSocketCloseEventStatusCode.CLOSE_PROTOCOL_ERROR);
+        return;
+      }
       const version = socket.protocol.substring(
-        protocolIndex + Protocol.UI.length
+        socket.protocol.indexOf(Protocol.UI) + Protocol.UI.length
       ) as ProtocolVersion;
-      if (!this.uiServices.has(version)) {
-        this.uiServices.set(version, UIServiceFactory.getUIServiceImplementation(version, this));
+      let uiService = this.uiServices.get(version);
+      if (!uiService) {
+        uiService = UIServiceFactory.getUIServiceImplementation(version, this);
+        this.uiServices.set(version, uiService);
       }
       // FIXME: check connection validity
       socket.on('message', (messageData) => {
-        this.uiServices
-          .get(version)
+        uiService
           .messageHandler(messageData)
           .catch(() => {
             logger.error(`${this.logPrefix()} Error while handling message data: %j`, messageData);
           });
       });
-      socket.on('error', (error) => {
-        logger.error(`${this.logPrefix()} Error on WebSocket: %j`, error);
-      });
     });
   }
 
@@ -53,9 +61,11 @@ export default class UIWebSocketServer extends AbstractUIServer {
   }
 
   private broadcastToClients(message: string): void {
+    // Encode the message once for all clients
+    const data = Buffer.from(message);
     for (const client of (this.server as WebSocket.Server).clients) {
       if (client?.readyState === WebSocket.OPEN) {
-        client.send(message);
+        client.send(data, { binary: false });
       }
     }
   }
@@ -35,10 +35,11 @@ export default abstract class AbstractUIService {
       throw new BaseError('UI protocol request is not iterable');
     }
     let messageResponse: JsonType;
-    if (this.messageHandlers.has(command)) {
+    const messageHandler = this.messageHandlers.get(command);
+    if (messageHandler) {
       try {
         // Call the message handler to build the message response
-        messageResponse = (await this.messageHandlers.get(command)(payload)) as JsonType;
+        messageResponse = (await messageHandler(payload)) as JsonType;
       } catch (error) {
         // Log
         logger.error(this.uiServer.logPrefix() + ' Handle message error: %j', error);
@@ -5,6 +5,17 @@ import logger from '../../../utils/Logger';
 import Utils from '../../../utils/Utils';
 
 export class UIServiceUtils {
+  private static readonly protocols: Set<Protocol> = new Set<Protocol>(Object.values(Protocol));
+  private static readonly protocolVersions: Set<ProtocolVersion> = new Set<ProtocolVersion>(
+    Object.values(ProtocolVersion)
+  );
+
+  private static readonly isLoopbackRegExp = new RegExp(
+    // eslint-disable-next-line no-useless-escape
+    /^localhost$|^127(?:\.\d+){0,2}\.\d+$|^(?:0*\:)*?:?0*1$/,
+    'i'
+  );
+
   private constructor() {
     // This is intentional
   }
@@ -23,10 +34,7 @@ export class UIServiceUtils {
         protocolIndex + Protocol.UI.length
       ) as Protocol;
       version = fullProtocol.substring(protocolIndex + Protocol.UI.length) as ProtocolVersion;
-      if (
-        Object.values(Protocol).includes(protocol) &&
-        Object.values(ProtocolVersion).includes(version)
-      ) {
+      if (UIServiceUtils.protocols.has(protocol) && UIServiceUtils.protocolVersions.has(version)) {
         return fullProtocol;
       }
     }
@@ -39,11 +47,6 @@ export class UIServiceUtils {
   };
 
   public static isLoopback(address: string): boolean {
-    const isLoopbackRegExp = new RegExp(
-      // eslint-disable-next-line no-useless-escape
-      /^localhost$|^127(?:\.\d+){0,2}\.\d+$|^(?:0*\:)*?:?0*1$/,
-      'i'
-    );
-    return isLoopbackRegExp.test(address);
+    return UIServiceUtils.isLoopbackRegExp.test(address);
   }
 }
@@ -135,10 +135,11 @@ export default class PerformanceStatistics {
     this.performanceObserver = new PerformanceObserver((list) => {
       const lastPerformanceEntry = list.getEntries()[0];
       this.addPerformanceEntryToStatistics(lastPerformanceEntry);
-      logger.debug(
-        `${this.logPrefix()} '${lastPerformanceEntry.name}' performance entry: %j`,
-        lastPerformanceEntry
-      );
+      logger.isDebugEnabled() &&
+        logger.debug(
+          `${this.logPrefix()} '${lastPerformanceEntry.name}' performance entry: %j`,
+          lastPerformanceEntry
+        );
     });
     this.performanceObserver.observe({ entryTypes: ['measure'] });
   }
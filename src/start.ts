@@ -4,8 +4,22 @@ import chalk from 'chalk';
 
 import Bootstrap from './charging-station/Bootstrap';
 
-Bootstrap.getInstance()
-  .start()
-  .catch((error) => {
-    console.error(chalk.red(error));
+const bootstrap = Bootstrap.getInstance();
+
+const started = bootstrap.start().catch((error) => {
+  console.error(chalk.red(error));
+});
+
+// Stop gracefully on the first signal, a second one falls back to the default handler
+for (const signal of ['SIGINT', 'SIGTERM'] as NodeJS.Signals[]) {
+  process.once(signal, () => {
+    // Let an in progress start finish so that stop() has workers and storage to release
+    started
+      .then(async () => bootstrap.stop())
+      .then(() => process.exit(0))
+      .catch((error) => {
+        console.error(chalk.red(error));
+        process.exit(1);
+      });
   });
+}
@@ -61,6 +61,7 @@ export default class Configuration {
       options: {
         host: Constants.DEFAULT_UI_WEBSOCKET_SERVER_HOST,
         port: Constants.DEFAULT_UI_WEBSOCKET_SERVER_PORT,
+        maxPayload: Constants.DEFAULT_UI_WEBSOCKET_SERVER_MAX_PAYLOAD,
       },
     };
     if (Configuration.objectHasOwnProperty(Configuration.getConfig(), 'uiServer')) {
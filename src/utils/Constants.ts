@@ -10,6 +10,7 @@ import {
 } from '../types/ocpp/Responses';
 
 export default class Constants {
+  static readonly OCPP_REQUEST_EMPTY = Object.freeze({});
   static readonly OCPP_RESPONSE_EMPTY = Object.freeze({});
   static readonly OCPP_RESPONSE_ACCEPTED = Object.freeze({ status: DefaultStatus.ACCEPTED });
   static readonly OCPP_RESPONSE_REJECTED = Object.freeze({ status: DefaultStatus.REJECTED });
@@ -118,6 +119,7 @@ export default class Constants {
 
   static readonly DEFAULT_UI_WEBSOCKET_SERVER_HOST = 'localhost';
   static readonly DEFAULT_UI_WEBSOCKET_SERVER_PORT = 8080;
+  static readonly DEFAULT_UI_WEBSOCKET_SERVER_MAX_PAYLOAD = 1048576; // Bytes
 
   private constructor() {
     // This is intentional
@@ -3,12 +3,50 @@ import crypto from 'crypto';
 import { v4 as uuid } from 'uuid';
 
 export default class Utils {
+  private static isoDateStringSecond = 0;
+  private static isoDateStringPrefix: string;
+  private static localeDateStringSecond = 0;
+  private static localeDateString: string;
+  private static readonly secureRandomPool: Uint32Array = new Uint32Array(256);
+  private static secureRandomPoolIndex = Utils.secureRandomPool.length;
+
   private constructor() {
     // This is intentional
   }
 
   public static logPrefix(prefixString = ''): string {
-    return new Date().toLocaleString() + prefixString;
+    return Utils.getLocaleDateString() + prefixString;
+  }
+
+  /**
+   * Get the current date locale string, formatted once per second
+   *
+   * @returns current date locale string
+   */
+  public static getLocaleDateString(): string {
+    const now = Date.now();
+    const nowSecond = Math.floor(now / 1000);
+    if (nowSecond !== Utils.localeDateStringSecond || !Utils.localeDateString) {
+      Utils.localeDateStringSecond = nowSecond;
+      Utils.localeDateString = new Date(now).toLocaleString();
+    }
+    return Utils.localeDateString;
+  }
+
+  /**
+   * Get the current date ISO 8601 string, formatted once per second with spliced milliseconds
+   *
+   * @returns current date ISO 8601 string
+   */
+  public static getISODateString(): string {
+    const now = Date.now();
+    const nowSecond = Math.floor(now / 1000);
+    if (nowSecond !== Utils.isoDateStringSecond || !Utils.isoDateStringPrefix) {
+      Utils.isoDateStringSecond = nowSecond;
+      // 'YYYY-MM-DDTHH:mm:ss.' part of the ISO 8601 string
+      Utils.isoDateStringPrefix = new Date(now).toISOString().substring(0, 20);
+    }
+    return `${Utils.isoDateStringPrefix}${(now % 1000).toString().padStart(3, '0')}Z`;
   }
 
   public static generateUUID(): string {
@@ -105,7 +143,7 @@ export default class Utils {
     if (max < min || min < 0 || max < 0) {
       throw new RangeError('Invalid interval');
     }
-    const randomPositiveFloat = crypto.randomBytes(4).readUInt32LE() / 0xffffffff;
+    const randomPositiveFloat = Utils.getSecureRandomUInt32() / 0xffffffff;
     const sign = negative && randomPositiveFloat < 0.5 ? -1 : 1;
     return sign * (randomPositiveFloat * (max - min) + min);
   }
@@ -218,16 +256,22 @@ export default class Utils {
       /* This is intentional */
     }
   ): Promise<T> {
+    let timeoutHandle: NodeJS.Timeout;
     // Create a timeout promise that rejects in timeout milliseconds
     const timeoutPromise = new Promise<never>((_, reject) => {
-      setTimeout(() => {
+      timeoutHandle = setTimeout(() => {
         timeoutCallback();
         reject(timeoutError);
       }, timeoutMs);
     });
 
     // Returns a race between timeout promise and the passed promise
-    return Promise.race<T>([promise, timeoutPromise]);
+    try {
+      return await Promise.race<T>([promise, timeoutPromise]);
+    } finally {
+      // Do not keep the timer armed once the race is settled
+      clearTimeout(timeoutHandle);
+    }
   }
 
   /**
@@ -236,6 +280,19 @@ export default class Utils {
    * @returns
    */
   public static secureRandom(): number {
-    return crypto.randomBytes(4).readUInt32LE() / 0x100000000;
+    return Utils.getSecureRandomUInt32() / 0x100000000;
+  }
+
+  /**
+   * Get a cryptographically secure random unsigned 32 bits integer from a pool refilled in batch
+   *
+   * @returns
+   */
+  private static getSecureRandomUInt32(): number {
+    if (Utils.secureRandomPoolIndex >= Utils.secureRandomPool.length) {
+      crypto.randomFillSync(Utils.secureRandomPool);
+      Utils.secureRandomPoolIndex = 0;
+    }
+    return Utils.secureRandomPool[Utils.secureRandomPoolIndex++];
   }
 }
@@ -0,0 +1,55 @@
+import { expect } from 'expect';
+
+import Utils from '../../src/utils/Utils';
+
+describe('Utils test suite', () => {
+  it('Verify getISODateString() format', () => {
+    expect(Utils.getISODateString()).toMatch(/^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z$/);
+  });
+
+  it('Verify getISODateString() matches Date.toISOString()', () => {
+    const dateNow = Date.now;
+    try {
+      const baseTime = Date.UTC(2022, 5, 15, 10, 20, 30);
+      for (const milliSeconds of [0, 1, 9, 10, 42, 99, 100, 999, 1000, 1005, 61099]) {
+        const now = baseTime + milliSeconds;
+        Date.now = () => now;
+        expect(Utils.getISODateString()).toBe(new Date(now).toISOString());
+      }
+    } finally {
+      Date.now = dateNow;
+    }
+  });
+
+  it('Verify promiseWithTimeout() resolves with the promise value', async () => {
+    let timeoutCallbackCalled = false;
+    const result = await Utils.promiseWithTimeout(
+      Promise.resolve('value'),
+      50,
+      new Error('Timeout'),
+      () => {
+        timeoutCallbackCalled = true;
+      }
+    );
+    expect(result).toBe('value');
+    // Wait past the timeout to check that the timer does not fire afterwards
+    await Utils.sleep(100);
+    expect(timeoutCallbackCalled).toBe(false);
+  });
+
+  it('Verify promiseWithTimeout() rejects and calls timeoutCallback on timeout', async () => {
+    let timeoutCallbackCalled = false;
+    const timeoutError = new Error('Timeout');
+    await expect(
+      Utils.promiseWithTimeout(
+        new Promise((resolve) => setTimeout(resolve, 200)),
+        50,
+        timeoutError,
+        () => {
+          timeoutCallbackCalled = true;
+        }
+      )
+    ).rejects.toBe(timeoutError);
+    expect(timeoutCallbackCalled).toBe(true);
+  });
+});